@@ -4,6 +4,9 @@ VideoTranscriber Core Module
 This package contains the core functionality for video transcription:
 - VideoConverter: Convert video files to audio
 - AudioTranscriber: Transcribe audio files to text using Whisper AI
+
+Heavy dependencies (Whisper, moviepy, tkinter) are imported lazily, so importing
+this package stays fast.
 """
 
 from .video_converter import VideoConverter, PathUtils
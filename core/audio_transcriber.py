@@ -2,16 +2,219 @@
 Audio Transcriber Module
 
 This module provides functionality to transcribe audio files to text using OpenAI's Whisper.
+When faster-whisper is installed, the same Whisper weights are run through CTranslate2's
+quantized kernels instead of the reference PyTorch implementation.
 """
 
 import os
-import whisper
 import json
+import importlib.util
+import shutil
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, cached_property
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict, List
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Tuple, ClassVar, Callable
 from datetime import datetime
-import tkinter as tk
-from tkinter import filedialog
+
+from .video_converter import PathUtils, VideoConverter, _VIDEO_EXTS
+
+try:
+    import orjson  # Optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+# Whisper backends are heavy (torch/CTranslate2), so they are only imported when a
+# model is actually loaded; here we just check whether faster-whisper is installed.
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+
+# Optional Silero VAD used to skip non-speech audio with the openai-whisper backend
+# (faster-whisper ships its own copy of it, enabled through vad_filter)
+HAS_SILERO_VAD = importlib.util.find_spec("silero_vad") is not None
+
+# Directory for pre-converted CTranslate2 models (enabled with VT_ENABLE_MODEL_CACHE=1)
+MODEL_CACHE_DIR = Path.home() / ".cache" / "videotranscriber"
+
+# Hugging Face checkpoints converted into MODEL_CACHE_DIR, where the size name alone
+# doesn't match what faster-whisper loads (other sizes map to openai/whisper-<size>)
+HF_MODEL_IDS = {
+    "large": "openai/whisper-large-v3"
+}
+
+# Audio file extensions picked up by batch_transcribe (lower-case, without the dot)
+_AUDIO_EXTS = frozenset({'mp3', 'wav', 'm4a', 'flac', 'aac', 'ogg', 'wma'})
+
+# Fields read from every segment by the subtitle writers
+_SEGMENT_FIELDS = itemgetter("start", "end", "text")
+
+# Sample rate expected by Whisper models
+SAMPLE_RATE = 16000
+
+# Suffix of decoded-audio files written next to the input (enabled with VT_ENABLE_AUDIO_CACHE=1)
+AUDIO_CACHE_SUFFIX = ".whisper.npy"
+
+# Pauses shorter than this are kept when non-speech audio is skipped
+VAD_MIN_SILENCE_MS = 500
+
+# Progress callback of the openai-whisper transcription running on each thread
+_WHISPER_PROGRESS = threading.local()
+
+
+def detect_device(backend: str) -> str:
+    """
+    Return "cuda" if the given backend can run on a CUDA GPU, otherwise "cpu".
+    
+    Each backend is asked through its own runtime: CTranslate2 wheels can ship CUDA
+    support while the installed torch is CPU-only (or missing), and the other way round.
+    """
+    try:
+        if backend == "faster-whisper":
+            import ctranslate2
+            return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def _forward_whisper_progress():
+    """
+    Make openai-whisper report its progress to _WHISPER_PROGRESS.callback.
+    
+    whisper.transcribe() only reports progress through a tqdm bar over the audio
+    frames, so the tqdm it uses is replaced with a subclass that also passes the
+    transcribed fraction to the callback of the calling thread.
+    """
+    whisper_transcribe = importlib.import_module("whisper.transcribe")
+    if getattr(whisper_transcribe.tqdm, "forwards_progress", False):
+        return
+    import tqdm
+    
+    class ProgressBar(tqdm.tqdm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Counted here as well: a disabled bar (Whisper's default) doesn't advance n
+            self.frames_done = 0
+        
+        def update(self, n=1):
+            super().update(n)
+            self.frames_done += n
+            callback = getattr(_WHISPER_PROGRESS, "callback", None)
+            if callback and self.total:
+                callback(min(self.frames_done / self.total, 1.0))
+    
+    whisper_transcribe.tqdm = SimpleNamespace(tqdm=ProgressBar, forwards_progress=True)
+
+
+def _decode_audio(backend: str, audio_path: str):
+    """
+    Decode an audio file to a 16 kHz mono float32 array with the backend's own decoder.
+    
+    With VT_ENABLE_AUDIO_CACHE=1 the decoded samples are also kept next to the file
+    as "<audio>.whisper.npy" and memory-mapped by later runs, as long as the audio
+    hasn't been modified since.
+    """
+    cache_path = None
+    if os.environ.get("VT_ENABLE_AUDIO_CACHE") == "1":
+        cache_path = audio_path + AUDIO_CACHE_SUFFIX
+        audio = _read_audio_cache(cache_path, os.path.getmtime(audio_path))
+        if audio is not None:
+            return audio
+    
+    if backend == "faster-whisper":
+        from faster_whisper import decode_audio
+        audio = decode_audio(audio_path, sampling_rate=SAMPLE_RATE)
+    else:
+        import whisper
+        audio = whisper.load_audio(audio_path, sr=SAMPLE_RATE)
+    
+    if cache_path is not None:
+        _write_audio_cache(cache_path, audio)
+    return audio
+
+
+def _read_audio_cache(cache_path: str, mtime: float):
+    """Memory-map previously decoded audio, or return None if it's missing or stale."""
+    try:
+        if os.stat(cache_path).st_mtime < mtime:
+            return None
+        import numpy as np
+        # Copy-on-write mapping: pages are read lazily, and the array stays writable
+        # for code that converts it to a tensor without touching the cache file
+        return np.load(cache_path, mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_audio_cache(cache_path: str, audio):
+    """Save decoded audio for _read_audio_cache(); failures only skip the cache."""
+    import numpy as np
+    
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _load_vad_model():
+    """Load the Silero VAD model once per process."""
+    from silero_vad import load_silero_vad
+    return load_silero_vad()
+
+
+def _remove_silence(audio) -> Tuple[object, List[Tuple[float, float]]]:
+    """
+    Drop non-speech regions from 16 kHz audio using Silero VAD.
+    
+    Returns:
+        tuple: (voiced_audio, offsets) where offsets holds (voiced_start, original_start)
+               in seconds for every kept chunk; offsets is empty if no speech was found
+    """
+    import numpy as np
+    import torch
+    from silero_vad import get_speech_timestamps
+    
+    speech = get_speech_timestamps(torch.from_numpy(np.ascontiguousarray(audio)), _load_vad_model(),
+                                   sampling_rate=SAMPLE_RATE,
+                                   min_silence_duration_ms=VAD_MIN_SILENCE_MS)
+    if not speech:
+        return audio, []
+    
+    offsets = []
+    voiced_samples = 0
+    for chunk in speech:
+        offsets.append((voiced_samples / SAMPLE_RATE, chunk["start"] / SAMPLE_RATE))
+        voiced_samples += chunk["end"] - chunk["start"]
+    
+    voiced_audio = np.concatenate([audio[chunk["start"]:chunk["end"]] for chunk in speech])
+    return voiced_audio, offsets
+
+
+def _restore_timestamps(segments: List[Dict], offsets: List[Tuple[float, float]]):
+    """Map segment times in VAD-trimmed audio back to times in the original audio."""
+    voiced_starts = [voiced_start for voiced_start, _ in offsets]
+    
+    def restore(seconds: float, bisect) -> float:
+        voiced_start, original_start = offsets[max(bisect(voiced_starts, seconds) - 1, 0)]
+        return original_start + seconds - voiced_start
+    
+    # A time exactly on a chunk boundary is the start of the next chunk but the end of
+    # the previous one, so ends look up the chunk they close (bisect_left); otherwise
+    # a subtitle would stay up through the silence that was cut out after it
+    for segment in segments:
+        segment["start"] = restore(segment["start"], bisect_right)
+        segment["end"] = restore(segment["end"], bisect_left)
 
 
 class AudioTranscriber:
@@ -26,30 +229,191 @@ class AudioTranscriber:
         "large": "Highest accuracy (~2.9 GB)"
     }
     
-    def __init__(self, model_size: str = "base"):
+    # Available inference backends
+    BACKENDS = {
+        "faster-whisper": "CTranslate2 with int8/float16 quantization (recommended)",
+        "whisper": "Reference OpenAI PyTorch implementation"
+    }
+    
+    # Loaded models shared by all instances, keyed by (backend, model_size, compute_type)
+    _MODEL_CACHE: ClassVar[Dict[Tuple[str, str, str], object]] = {}
+    _MODEL_CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(self, model_size: str = "base", compute_type: Optional[str] = None,
+                 backend: Optional[str] = None):
         """
         Initialize the transcriber with a specific Whisper model.
         
         Args:
             model_size (str): Whisper model size ("tiny", "base", "small", "medium", "large")
+            compute_type (str, optional): CTranslate2 compute type used by faster-whisper.
+                                          If None, "int8_float16" on GPU and "int8" on CPU.
+                                          Ignored by openai-whisper, which uses fp16 on
+                                          GPU and fp32 on CPU
+            backend (str, optional): Inference backend ("faster-whisper", "whisper").
+                                     If None, faster-whisper when installed
         """
         if model_size not in self.MODELS:
             raise ValueError(f"Invalid model size. Choose from: {list(self.MODELS.keys())}")
         
+        if backend is None:
+            backend = "faster-whisper" if HAS_FASTER_WHISPER else "whisper"
+        elif backend not in self.BACKENDS:
+            raise ValueError(f"Invalid backend. Choose from: {list(self.BACKENDS.keys())}")
+        elif backend == "faster-whisper" and not HAS_FASTER_WHISPER:
+            raise ImportError("faster-whisper is not installed. Run: pip install faster-whisper")
+        
         self.model_size = model_size
-        self.model = None
+        self.backend = backend
+        self.device = detect_device(backend)
+        if backend == "whisper":
+            # Not used by openai-whisper; kept out of the model cache key so different
+            # settings don't load duplicate copies of the same model
+            self.compute_type = None
+        else:
+            self.compute_type = compute_type or ("int8_float16" if self.device == "cuda" else "int8")
         print(f"Initializing Whisper with '{model_size}' model...")
         print(f"Model info: {self.MODELS[model_size]}")
     
-    def _load_model(self):
-        """Load the Whisper model (lazy loading)."""
-        if self.model is None:
-            print(f"Loading Whisper '{self.model_size}' model... (this may take a moment)")
-            self.model = whisper.load_model(self.model_size)
-            print("✅ Model loaded successfully!")
+    @cached_property
+    def model(self):
+        """The Whisper model (loaded on first access, shared across instances)."""
+        key = (self.backend, self.model_size, self.compute_type)
+        with self._MODEL_CACHE_LOCK:
+            if key not in self._MODEL_CACHE:
+                print(f"Loading Whisper '{self.model_size}' model... (this may take a moment)")
+                self._MODEL_CACHE[key] = self._create_model()
+                print("✅ Model loaded successfully!")
+        return self._MODEL_CACHE[key]
+    
+    def _create_model(self):
+        """Create a new model instance for the configured backend."""
+        if self.backend == "faster-whisper":
+            from faster_whisper import WhisperModel
+            
+            model_source = self.model_size
+            if os.environ.get("VT_ENABLE_MODEL_CACHE") == "1":
+                model_source = self._get_cached_model_dir()
+            return WhisperModel(model_source, device=self.device,
+                                compute_type=self.compute_type)
+        import whisper
+        model = whisper.load_model(self.model_size, device=self.device)
+        _forward_whisper_progress()
+        
+        # Opt-in: compile the encoder so repeated transcribe() calls in a batch reuse
+        # the captured graph. Only the encoder is compiled; the autoregressive
+        # decoder gains little. Off by default because the first call pays the
+        # compile time and torch.compile needs a working compiler toolchain.
+        if os.environ.get("VT_COMPILE") == "1":
+            import torch
+            if hasattr(torch, "compile"):
+                model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+        return model
+    
+    def _get_cached_model_dir(self) -> str:
+        """
+        Return a pre-quantized CTranslate2 model directory for the current settings.
+        
+        The model is converted once into MODEL_CACHE_DIR so later runs load the
+        already-quantized weights directly. Falls back to the model size name
+        (the regular faster-whisper download) if conversion is not possible.
+        """
+        # Same checkpoint faster-whisper downloads for this size ("large" is large-v3)
+        model_id = HF_MODEL_IDS.get(self.model_size, f"openai/whisper-{self.model_size}")
+        cache_path = MODEL_CACHE_DIR / f"{model_id.rpartition('/')[2]}-{self.compute_type}.ct2"
+        # model.bin is written last, so a directory without it is an interrupted conversion
+        if (cache_path / "model.bin").exists():
+            return str(cache_path)
+        
+        tmp_path = None
+        try:
+            import ctranslate2
+            print(f"Converting '{self.model_size}' model into cache: {cache_path}")
+            MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Convert next to the final location and move it into place when complete
+            tmp_path = Path(tempfile.mkdtemp(prefix=cache_path.name + ".", dir=MODEL_CACHE_DIR))
+            converter = ctranslate2.converters.TransformersConverter(
+                model_id,
+                copy_files=["tokenizer.json", "preprocessor_config.json"]
+            )
+            converter.convert(str(tmp_path), quantization=self.compute_type, force=True)
+            if cache_path.exists():
+                shutil.rmtree(cache_path)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+            return str(cache_path)
+        except Exception as e:
+            print(f"⚠️ Could not cache model, loading normally: {e}")
+            return self.model_size
+        finally:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+    
+    def load_audio(self, audio_path: str):
+        """
+        Decode an audio file into the float32 array passed to the model.
+        
+        Nothing is kept in memory between calls; to run several passes over the
+        same file, decode it once and pass the array as transcribe_audio(audio=...).
+        """
+        return _decode_audio(self.backend, os.path.abspath(audio_path))
+    
+    def _run_model(self, audio, language: Optional[str] = None,
+                   progress_callback: Optional[Callable[[float], None]] = None) -> Dict:
+        """
+        Run the loaded model and return a Whisper-style result dict.
+        
+        faster-whisper returns a lazy segment generator plus an info object, so it is
+        converted to the same {"text", "segments", "language"} layout that
+        openai-whisper produces and the writers in save_transcription() expect.
+        progress_callback receives the transcribed fraction of the audio (0.0-1.0)
+        as each segment (faster-whisper) or 30 s window (openai-whisper) is decoded.
+        """
+        if self.backend != "faster-whisper":
+            # Skip silence before the encoder pass, then shift timestamps back
+            offsets = []
+            if HAS_SILERO_VAD:
+                audio, offsets = _remove_silence(audio)
+            
+            # FP16 only pays off on GPU; on CPU Whisper would warn and fall back to FP32
+            fp16 = self.device == "cuda"
+            _WHISPER_PROGRESS.callback = progress_callback
+            try:
+                if language:
+                    result = self.model.transcribe(audio, language=language, fp16=fp16)
+                else:
+                    result = self.model.transcribe(audio, fp16=fp16)
+            finally:
+                _WHISPER_PROGRESS.callback = None
+            
+            if offsets:
+                _restore_timestamps(result["segments"], offsets)
+            if progress_callback:
+                progress_callback(1.0)
+            return result
+        
+        segments, info = self.model.transcribe(
+            audio, language=language, vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": VAD_MIN_SILENCE_MS}
+        )
+        results = []
+        for s in segments:
+            results.append({"start": s.start, "end": s.end, "text": s.text, "avg_logprob": s.avg_logprob})
+            if progress_callback and info.duration:
+                progress_callback(min(s.end / info.duration, 1.0))
+        segments = results
+        if progress_callback:
+            progress_callback(1.0)
+        return {
+            "text": "".join(s["text"] for s in segments),
+            "segments": segments,
+            "language": info.language
+        }
     
     def transcribe_audio(self, audio_path: str, language: Optional[str] = None, 
-                        output_format: str = "txt") -> Dict:
+                        output_format: str = "txt", audio=None,
+                        progress_callback: Optional[Callable[[float], None]] = None,
+                        verbose: bool = True) -> Dict:
         """
         Transcribe an audio file to text.
         
@@ -58,6 +422,11 @@ class AudioTranscriber:
             language (str, optional): Language code (e.g., "en", "es", "fr"). 
                                     If None, auto-detect
             output_format (str): Output format ("txt", "json", "srt", "vtt")
+            audio (numpy.ndarray, optional): Already decoded 16 kHz mono float32 samples
+                                            of audio_path. If None, the file is decoded
+            progress_callback (callable, optional): Called with the transcribed
+                                                    fraction of the audio (0.0-1.0)
+            verbose (bool): Print progress messages (default: True)
             
         Returns:
             dict: Transcription result with text, segments, and metadata
@@ -70,38 +439,41 @@ class AudioTranscriber:
         if not os.path.exists(audio_path):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         
-        # Load model if not already loaded
-        self._load_model()
-        
         try:
-            print(f"🎵 Transcribing: {audio_path}")
+            if verbose:
+                print(f"🎵 Transcribing: {audio_path}")
+                print(f"🌍 Using language: {language}" if language else "🌍 Auto-detecting language...")
             
             # Transcribe the audio
-            if language:
-                print(f"🌍 Using language: {language}")
-                result = self.model.transcribe(audio_path, language=language)
-            else:
-                print("🌍 Auto-detecting language...")
-                result = self.model.transcribe(audio_path)
+            if audio is None:
+                # Load the model while the audio file is being decoded
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    model_future = executor.submit(getattr, self, "model")
+                    audio = self.load_audio(audio_path)
+                    model_future.result()
+            result = self._run_model(audio, language, progress_callback)
             
             # Add metadata
             result["metadata"] = {
                 "audio_file": audio_path,
                 "model_used": self.model_size,
+                "backend": self.backend,
                 "transcription_date": datetime.now().isoformat(),
                 "detected_language": result.get("language", "unknown")
             }
             
-            print(f"✅ Transcription completed!")
-            print(f"📝 Detected language: {result['metadata']['detected_language']}")
-            print(f"📊 Text length: {len(result['text'])} characters")
+            if verbose:
+                print(f"✅ Transcription completed!")
+                print(f"📝 Detected language: {result['metadata']['detected_language']}")
+                print(f"📊 Text length: {len(result['text'])} characters")
             
             return result
             
         except Exception as e:
             raise Exception(f"Error during transcription: {str(e)}")
     
-    def save_transcription(self, result: Dict, output_path: str, format_type: str = "txt"):
+    def save_transcription(self, result: Dict, output_path: str, format_type: str = "txt",
+                           json_indent: bool = False, verbose: bool = True):
         """
         Save transcription result to file.
         
@@ -109,6 +481,9 @@ class AudioTranscriber:
             result (dict): Transcription result from transcribe_audio()
             output_path (str): Path to save the transcription
             format_type (str): Format type ("txt", "json", "srt", "vtt")
+            json_indent (bool): Pretty-print JSON output with 2-space indentation.
+                                Compact JSON is written by default
+            verbose (bool): Print where the file was saved (default: True)
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -132,52 +507,62 @@ class AudioTranscriber:
             
             elif format_type.lower() == "json":
                 # JSON format with all details
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    option = orjson.OPT_INDENT_2 if json_indent else 0
+                    with open(output_path, "wb") as f:
+                        f.write(orjson.dumps(result, option=option | orjson.OPT_SERIALIZE_NUMPY))
+                else:
+                    with open(output_path, "w", encoding="utf-8") as f:
+                        if json_indent:
+                            json.dump(result, f, indent=2, ensure_ascii=False)
+                        else:
+                            json.dump(result, f, separators=(",", ":"), ensure_ascii=False)
             
             elif format_type.lower() == "srt":
                 # SRT subtitle format
-                with open(output_path, "w", encoding="utf-8") as f:
-                    for i, segment in enumerate(result["segments"], 1):
-                        start_time = self._seconds_to_srt_time(segment["start"])
-                        end_time = self._seconds_to_srt_time(segment["end"])
-                        f.write(f"{i}\n")
-                        f.write(f"{start_time} --> {end_time}\n")
-                        f.write(f"{segment['text'].strip()}\n\n")
+                # Build the whole payload first and write it in one call
+                to_time = self._seconds_to_srt_time
+                with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write("".join(
+                        f"{i}\n{to_time(start)} --> {to_time(end)}\n{text.strip()}\n\n"
+                        for i, (start, end, text) in enumerate(map(_SEGMENT_FIELDS, result["segments"]), 1)
+                    ))
             
             elif format_type.lower() == "vtt":
                 # WebVTT format
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write("WEBVTT\n\n")
-                    for segment in result["segments"]:
-                        start_time = self._seconds_to_vtt_time(segment["start"])
-                        end_time = self._seconds_to_vtt_time(segment["end"])
-                        f.write(f"{start_time} --> {end_time}\n")
-                        f.write(f"{segment['text'].strip()}\n\n")
+                to_time = self._seconds_to_vtt_time
+                with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write("WEBVTT\n\n" + "".join(
+                        f"{to_time(start)} --> {to_time(end)}\n{text.strip()}\n\n"
+                        for start, end, text in map(_SEGMENT_FIELDS, result["segments"])
+                    ))
             
-            print(f"💾 Transcription saved to: {output_path}")
+            if verbose:
+                print(f"💾 Transcription saved to: {output_path}")
             
         except Exception as e:
             raise Exception(f"Error saving transcription: {str(e)}")
     
     def _seconds_to_srt_time(self, seconds: float) -> str:
         """Convert seconds to SRT time format (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millisecs:03d}"
+        millisecs = int(seconds * 1000)
+        hours, millisecs = divmod(millisecs, 3_600_000)
+        minutes, millisecs = divmod(millisecs, 60_000)
+        secs, millisecs = divmod(millisecs, 1000)
+        return "%02d:%02d:%02d,%03d" % (hours, minutes, secs, millisecs)
     
     def _seconds_to_vtt_time(self, seconds: float) -> str:
         """Convert seconds to VTT time format (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millisecs = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millisecs:03d}"
+        millisecs = int(seconds * 1000)
+        hours, millisecs = divmod(millisecs, 3_600_000)
+        minutes, millisecs = divmod(millisecs, 60_000)
+        secs, millisecs = divmod(millisecs, 1000)
+        return "%02d:%02d:%02d.%03d" % (hours, minutes, secs, millisecs)
     
     def transcribe_and_save(self, audio_path: str, output_path: Optional[str] = None,
-                          language: Optional[str] = None, output_format: str = "txt") -> str:
+                          language: Optional[str] = None, output_format: str = "txt",
+                          progress_callback: Optional[Callable[[float], None]] = None,
+                          verbose: bool = True) -> str:
         """
         Transcribe audio and save to file in one step.
         
@@ -186,6 +571,8 @@ class AudioTranscriber:
             output_path (str, optional): Output file path. If None, auto-generate
             language (str, optional): Language code for transcription
             output_format (str): Output format ("txt", "json", "srt", "vtt")
+            progress_callback (callable, optional): Called with overall progress (0.0-1.0)
+            verbose (bool): Print progress messages (default: True)
             
         Returns:
             str: Path to the saved transcription file
@@ -196,23 +583,127 @@ class AudioTranscriber:
             output_path = str(audio_file.parent / f"{audio_file.stem}_transcription.{output_format}")
         
         # Transcribe
-        result = self.transcribe_audio(audio_path, language, output_format)
+        result = self.transcribe_audio(audio_path, language, output_format,
+                                       progress_callback=progress_callback, verbose=verbose)
         
         # Save
-        self.save_transcription(result, output_path, output_format)
+        self.save_transcription(result, output_path, output_format, verbose=verbose)
         
         return output_path
     
+    def video_to_text(self, video_path: str, output_path: Optional[str] = None,
+                      language: Optional[str] = None, output_format: str = "txt",
+                      progress_callback: Optional[Callable[[float], None]] = None,
+                      verbose: bool = True) -> str:
+        """
+        Transcribe a video file and save the result, without an intermediate audio file.
+        
+        The audio track is decoded by ffmpeg straight into memory, skipping the
+        MP3 encode, write, read and decode of the two-step convert/transcribe flow.
+        
+        Args:
+            video_path (str): Path to the video file
+            output_path (str, optional): Output file path. If None, auto-generate
+            language (str, optional): Language code for transcription
+            output_format (str): Output format ("txt", "json", "srt", "vtt")
+            progress_callback (callable, optional): Called with overall progress (0.0-1.0);
+                                                    decoding covers the first half
+            verbose (bool): Print progress messages (default: True)
+            
+        Returns:
+            str: Path to the saved transcription file
+        """
+        # Resolve shortcuts ("desktop/clip.mp4") once, so decoding, the existence
+        # check, the metadata and the default output path all see the same file
+        video_path = PathUtils.resolve_path(video_path)
+        
+        if output_path is None:
+            video_file = Path(video_path)
+            output_path = str(video_file.parent / f"{video_file.stem}_transcription.{output_format}")
+        
+        # Decoding reports the first half of the progress, transcription the second
+        decode_progress = transcribe_progress = None
+        if progress_callback:
+            decode_progress = lambda done: progress_callback(done / 2)
+            transcribe_progress = lambda done: progress_callback(0.5 + done / 2)
+        
+        # Load the model while ffmpeg decodes the audio track
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            model_future = executor.submit(getattr, self, "model")
+            audio = VideoConverter.extract_pcm(video_path, progress_callback=decode_progress)
+            model_future.result()
+        
+        result = self.transcribe_audio(video_path, language, output_format, audio=audio,
+                                       progress_callback=transcribe_progress, verbose=verbose)
+        self.save_transcription(result, output_path, output_format, verbose=verbose)
+        
+        return output_path
+    
+    def _transcribe_one(self, input_file: str, output_directory: str, language: Optional[str],
+                        output_format: str, overwrite: bool = False) -> Optional[str]:
+        """Transcribe a single audio or video file for batch runs; returns None on failure."""
+        try:
+            input_name = Path(input_file).stem
+            output_path = os.path.join(output_directory, f"{input_name}_transcription.{output_format}")
+            
+            # Skip files whose transcription is already newer than the input
+            if not overwrite:
+                try:
+                    if os.stat(output_path).st_mtime >= os.stat(input_file).st_mtime:
+                        return output_path
+                except FileNotFoundError:
+                    pass
+            
+            # Per-file messages would tear the batch progress bar; only failures are reported
+            if input_file.rpartition('.')[2].lower() in _VIDEO_EXTS:
+                return self.video_to_text(input_file, output_path, language, output_format,
+                                          verbose=False)
+            return self.transcribe_and_save(input_file, output_path, language, output_format,
+                                            verbose=False)
+        except Exception as e:
+            from tqdm import tqdm
+            tqdm.write(f"❌ Failed to transcribe {input_file}: {str(e)}")
+            return None
+    
+    def _run_batch(self, input_files: List[str], output_directory: str, language: Optional[str],
+                   output_format: str, max_workers: Optional[int], overwrite: bool) -> List[str]:
+        """Transcribe files concurrently on threads sharing the loaded model."""
+        # tqdm ships with both Whisper backends; it batches terminal updates
+        from tqdm import tqdm
+        
+        if max_workers is None:
+            max_workers = 2 if self.backend == "faster-whisper" else 1
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._transcribe_one, input_file, output_directory,
+                                language, output_format, overwrite)
+                for input_file in input_files
+            ]
+            for _ in tqdm(as_completed(futures), total=len(futures), unit="file"):
+                pass
+            results = [future.result() for future in futures]
+        
+        return [path for path in results if path is not None]
+    
     def batch_transcribe(self, audio_directory: str, output_directory: Optional[str] = None,
-                        language: Optional[str] = None, output_format: str = "txt") -> List[str]:
+                        language: Optional[str] = None, output_format: str = "txt",
+                        max_workers: Optional[int] = None, overwrite: bool = False) -> List[str]:
         """
         Transcribe multiple audio files in a directory.
         
+        Files are transcribed concurrently on threads sharing the loaded model.
+        
         Args:
             audio_directory (str): Directory containing audio files
             output_directory (str, optional): Directory for output files
             language (str, optional): Language code for transcription
             output_format (str): Output format ("txt", "json", "srt", "vtt")
+            max_workers (int, optional): Number of concurrent transcriptions.
+                                         If None, 2 for faster-whisper and 1 for
+                                         openai-whisper (its decoder isn't thread-safe)
+            overwrite (bool): Re-transcribe files even if an up-to-date transcription
+                              (newer than the audio file) already exists
             
         Returns:
             list: List of paths to transcription files
@@ -225,33 +716,60 @@ class AudioTranscriber:
         
         os.makedirs(output_directory, exist_ok=True)
         
-        # Common audio file extensions
-        audio_extensions = {'.mp3', '.wav', '.m4a', '.flac', '.aac', '.ogg', '.wma'}
-        
-        audio_files = []
-        for file in os.listdir(audio_directory):
-            if Path(file).suffix.lower() in audio_extensions:
-                audio_files.append(os.path.join(audio_directory, file))
+        with os.scandir(audio_directory) as entries:
+            audio_files = [entry.path for entry in entries
+                           if entry.is_file()
+                           and entry.name.rpartition('.')[2].lower() in _AUDIO_EXTS]
         
-        transcribed_files = []
         print(f"🎵 Found {len(audio_files)} audio files to transcribe")
         
-        for i, audio_file in enumerate(audio_files, 1):
-            try:
-                print(f"\n📝 Processing file {i}/{len(audio_files)}")
-                audio_name = Path(audio_file).stem
-                output_path = os.path.join(output_directory, f"{audio_name}_transcription.{output_format}")
-                
-                result_path = self.transcribe_and_save(audio_file, output_path, language, output_format)
-                transcribed_files.append(result_path)
-                
-            except Exception as e:
-                print(f"❌ Failed to transcribe {audio_file}: {str(e)}")
-                continue
+        transcribed_files = self._run_batch(audio_files, output_directory, language,
+                                            output_format, max_workers, overwrite)
         
         print(f"\n🎉 Batch transcription completed! {len(transcribed_files)}/{len(audio_files)} files processed")
         return transcribed_files
     
+    def batch_video_to_text(self, video_directory: str, output_directory: Optional[str] = None,
+                            language: Optional[str] = None, output_format: str = "txt",
+                            max_workers: Optional[int] = None, overwrite: bool = False) -> List[str]:
+        """
+        Transcribe multiple video files in a directory without intermediate audio files.
+        
+        Replaces VideoConverter.batch_convert() followed by batch_transcribe(): each
+        video is decoded in memory and transcribed in one pass (see video_to_text()).
+        
+        Args:
+            video_directory (str): Directory containing video files
+            output_directory (str, optional): Directory for output files
+            language (str, optional): Language code for transcription
+            output_format (str): Output format ("txt", "json", "srt", "vtt")
+            max_workers (int, optional): Number of concurrent transcriptions (see batch_transcribe())
+            overwrite (bool): Re-transcribe videos that already have an up-to-date transcription
+            
+        Returns:
+            list: List of paths to transcription files
+        """
+        if not os.path.exists(video_directory):
+            raise FileNotFoundError(f"Directory not found: {video_directory}")
+        
+        if output_directory is None:
+            output_directory = os.path.join(video_directory, "transcriptions")
+        
+        os.makedirs(output_directory, exist_ok=True)
+        
+        with os.scandir(video_directory) as entries:
+            video_files = [entry.path for entry in entries
+                           if entry.is_file()
+                           and entry.name.rpartition('.')[2].lower() in _VIDEO_EXTS]
+        
+        print(f"🎬 Found {len(video_files)} video files to transcribe")
+        
+        transcribed_files = self._run_batch(video_files, output_directory, language,
+                                            output_format, max_workers, overwrite)
+        
+        print(f"\n🎉 Batch transcription completed! {len(transcribed_files)}/{len(video_files)} files processed")
+        return transcribed_files
+    
     @staticmethod
     def pick_audio_file(title: str = "Select Audio File") -> Optional[str]:
         """
@@ -264,9 +782,9 @@ class AudioTranscriber:
             str or None: Selected file path or None if cancelled
         """
         try:
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes('-topmost', True)
+            from tkinter import filedialog
+            
+            root = PathUtils.get_tk_root()
             
             filetypes = [
                 ("Audio files", "*.mp3 *.wav *.m4a *.flac *.aac *.ogg *.wma"),
@@ -276,11 +794,11 @@ class AudioTranscriber:
             ]
             
             file_path = filedialog.askopenfilename(
+                parent=root,
                 title=title,
                 filetypes=filetypes
             )
             
-            root.destroy()
             return file_path if file_path else None
             
         except Exception as e:
@@ -294,6 +812,8 @@ class AudioTranscriber:
         Returns:
             str or None: Path to transcription file, or None if cancelled
         """
+        from tkinter import filedialog
+        
         print("=== Interactive Audio Transcriber ===")
         
         # Pick audio file
@@ -312,11 +832,8 @@ class AudioTranscriber:
         
         # Pick output location
         print("Choose where to save the transcription...")
-        root = tk.Tk()
-        root.withdraw()
-        root.attributes('-topmost', True)
-        
         output_path = filedialog.asksaveasfilename(
+            parent=PathUtils.get_tk_root(),
             title="Save Transcription As",
             initialfile=default_output,
             filetypes=[
@@ -327,7 +844,6 @@ class AudioTranscriber:
                 ("All files", "*.*")
             ]
         )
-        root.destroy()
         
         if not output_path:
             print("No output location selected. Operation cancelled.")
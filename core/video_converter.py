@@ -1,23 +1,45 @@
 """
 Video to Audio Converter Module
 
-This module provides functionality to extract audio from video files using moviepy.
+This module provides functionality to extract audio from video files using FFmpeg,
+falling back to moviepy when the ffmpeg binary is not available.
 """
 
 import os
-from moviepy import VideoFileClip
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
-import tkinter as tk
-from tkinter import filedialog, messagebox
+from typing import Optional, Callable
+
+# Video file extensions picked up by batch_convert (lower-case, without the dot)
+_VIDEO_EXTS = frozenset({'mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm'})
+
+# Bytes read from ffmpeg's PCM pipe per call (about 1 s of 16 kHz float32 audio)
+PCM_READ_CHUNK = 1 << 16
+
+# Tk root shared by all file dialogs (registered by a host GUI, or a hidden
+# one created on first use)
+_tk_root = None
+
+# Recently resolved paths: (cwd, path_input) -> (timestamp, resolved_path)
+_resolve_cache = OrderedDict()
+_RESOLVE_CACHE_SIZE = 256
+_RESOLVE_CACHE_TTL = 60.0  # seconds
 
 
 class PathUtils:
     """Utility class for easier path handling and shortcuts."""
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_common_folders():
-        """Get common folder paths."""
+        """Get common folder paths (computed once per process)."""
         user_home = Path.home()
         return {
             "desktop": user_home / "Desktop",
@@ -29,6 +51,34 @@ class PathUtils:
             "onedrive_desktop": user_home / "OneDrive" / "Desktop"
         }
     
+    @staticmethod
+    def get_tk_root():
+        """
+        Get the hidden Tk root window used as parent for file dialogs.
+        
+        The root is created once and reused, instead of starting a new Tk
+        interpreter for every dialog.
+        """
+        global _tk_root
+        if _tk_root is None:
+            import tkinter as tk
+            
+            _tk_root = tk.Tk()
+            _tk_root.withdraw()
+            _tk_root.attributes('-topmost', True)
+        return _tk_root
+    
+    @staticmethod
+    def set_tk_root(root):
+        """
+        Register an application's existing Tk root as the parent for file dialogs.
+        
+        Applications that already run a Tk main window should call this once, so
+        the dialogs attach to that window instead of creating a second hidden root.
+        """
+        global _tk_root
+        _tk_root = root
+    
     @staticmethod
     def resolve_path(path_input: str) -> str:
         """
@@ -39,6 +89,9 @@ class PathUtils:
         - Relative paths: "./video.mp4"
         - Shortcuts: "desktop/video.mp4", "downloads/video.mp4"
         - Just filename: "video.mp4" (searches common folders)
+        
+        Successful lookups are cached for a short time, so resolving the same
+        path again doesn't repeat the existence checks.
         """
         path_input = path_input.strip()
         
@@ -46,16 +99,35 @@ class PathUtils:
         if os.path.isabs(path_input):
             return path_input
         
-        # If it starts with a shortcut
+        key = (os.getcwd(), path_input)
+        now = time.monotonic()
+        cached = _resolve_cache.get(key)
+        if cached is not None and now - cached[0] < _RESOLVE_CACHE_TTL:
+            return cached[1]
+        
+        resolved = PathUtils._search_path(path_input)
+        if resolved is None:
+            # Return original path if nothing else worked (not cached, the file may appear later)
+            return path_input
+        
+        _resolve_cache[key] = (now, resolved)
+        _resolve_cache.move_to_end(key)
+        if len(_resolve_cache) > _RESOLVE_CACHE_SIZE:
+            _resolve_cache.popitem(last=False)
+        return resolved
+    
+    @staticmethod
+    def _search_path(path_input: str) -> Optional[str]:
+        """Look for an existing file for resolve_path(); returns None if nothing matches."""
+        # If it starts with a shortcut, look up the first path component directly
         common_folders = PathUtils.get_common_folders()
         
-        for shortcut, folder_path in common_folders.items():
-            if path_input.startswith(f"{shortcut}/") or path_input.startswith(f"{shortcut}\\"):
-                # Remove the shortcut part and join with the actual path
-                relative_part = path_input[len(shortcut)+1:]
-                resolved = folder_path / relative_part
-                if resolved.exists():
-                    return str(resolved)
+        parts = path_input.replace("\\", "/").split("/", 1)
+        folder_path = common_folders.get(parts[0].lower())
+        if folder_path is not None and len(parts) == 2:
+            resolved = folder_path / parts[1]
+            if resolved.exists():
+                return str(resolved)
         
         # If it's just a filename, search in common folders
         if "/" not in path_input and "\\" not in path_input:
@@ -69,8 +141,7 @@ class PathUtils:
         if current_dir_path.exists():
             return str(current_dir_path.absolute())
         
-        # Return original path if nothing else worked
-        return path_input
+        return None
     
     @staticmethod
     def pick_video_file(title: str = "Select Video File") -> Optional[str]:
@@ -84,10 +155,9 @@ class PathUtils:
             str or None: Selected file path or None if cancelled
         """
         try:
-            # Create a root window but hide it
-            root = tk.Tk()
-            root.withdraw()
-            root.attributes('-topmost', True)
+            from tkinter import filedialog
+            
+            root = PathUtils.get_tk_root()
             
             # Video file types
             filetypes = [
@@ -103,12 +173,12 @@ class PathUtils:
             initial_dir = str(common_folders.get("desktop", Path.home()))
             
             file_path = filedialog.askopenfilename(
+                parent=root,
                 title=title,
                 initialdir=initial_dir,
                 filetypes=filetypes
             )
             
-            root.destroy()
             return file_path if file_path else None
             
         except Exception as e:
@@ -129,9 +199,9 @@ class PathUtils:
             str or None: Selected file path or None if cancelled
         """
         try:
-            root = tk.Tk() 
-            root.withdraw()
-            root.attributes('-topmost', True)
+            from tkinter import filedialog
+            
+            root = PathUtils.get_tk_root()
             
             filetypes = [
                 ("MP3 files", "*.mp3"),
@@ -144,13 +214,13 @@ class PathUtils:
             initial_dir = str(common_folders.get("music", Path.home()))
             
             file_path = filedialog.asksaveasfilename(
+                parent=root,
                 title=title,
                 initialdir=initial_dir,
                 initialfile=default_name,
                 filetypes=filetypes
             )
             
-            root.destroy()
             return file_path if file_path else None
             
         except Exception as e:
@@ -161,6 +231,100 @@ class PathUtils:
 class VideoConverter:
     """A class for converting video files to audio files."""
     
+    # Source audio codecs that can be copied into each output container without re-encoding
+    STREAM_COPY_CODECS = {
+        "mp3": {"mp3"},
+        "aac": {"aac"},
+        "m4a": {"aac", "alac"},
+        "flac": {"flac"},
+        "ogg": {"vorbis", "opus"},
+        "opus": {"opus"}
+    }
+    
+    # Output container for codecs that extract_audio_fast() can copy without re-encoding
+    NATIVE_CONTAINERS = {
+        "aac": "m4a",
+        "mp3": "mp3"
+    }
+    
+    @staticmethod
+    def _probe_duration(video_path: str) -> Optional[float]:
+        """
+        Get the container duration in seconds using ffprobe.
+        
+        Returns:
+            float or None: Duration, or None if it couldn't be determined
+        """
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration",
+                 "-of", "csv=p=0", video_path],
+                capture_output=True, text=True, check=True
+            )
+            return float(result.stdout.strip())
+        except (OSError, ValueError, subprocess.CalledProcessError):
+            return None
+    
+    @staticmethod
+    def _probe_audio_codec(video_path: str) -> Optional[str]:
+        """
+        Get the codec name of the first audio stream using ffprobe.
+        
+        Args:
+            video_path (str): Path to the video file
+            
+        Returns:
+            str or None: Codec name (e.g. "aac"), or None if it couldn't be determined
+        """
+        try:
+            result = subprocess.run(
+                ["ffprobe", "-v", "error", "-select_streams", "a:0",
+                 "-show_entries", "stream=codec_name", "-of", "csv=p=0", video_path],
+                capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        return result.stdout.strip() or None
+    
+    @staticmethod
+    def _extract_with_ffmpeg(video_path: str, audio_path: str):
+        """
+        Extract the audio track with ffmpeg, skipping the video stream entirely.
+        
+        The audio stream is copied as-is when the output container can hold it,
+        otherwise it is re-encoded (LAME VBR for MP3, ffmpeg's default encoder
+        for other containers).
+        """
+        output_format = Path(audio_path).suffix[1:].lower()
+        source_codec = VideoConverter._probe_audio_codec(video_path)
+        
+        if source_codec in VideoConverter.STREAM_COPY_CODECS.get(output_format, ()):
+            codec_args = ["-acodec", "copy"]
+        elif output_format == "mp3":
+            codec_args = ["-c:a", "libmp3lame", "-q:a", "2"]
+        else:
+            codec_args = []
+        
+        try:
+            subprocess.run(
+                ["ffmpeg", "-v", "error", "-y", "-i", video_path, "-vn", *codec_args, audio_path],
+                capture_output=True, text=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise Exception(f"ffmpeg failed: {e.stderr.strip()}")
+    
+    @staticmethod
+    def _extract_with_moviepy(video_path: str, audio_path: str):
+        """Extract the audio track with moviepy (used when ffmpeg isn't on PATH)."""
+        from moviepy import VideoFileClip
+        
+        video = VideoFileClip(video_path)
+        try:
+            video.audio.write_audiofile(audio_path)
+        finally:
+            # Close the video clip to free memory
+            video.close()
+    
     @staticmethod
     def extract_audio(video_path: str, audio_path: Optional[str] = None, 
                      audio_format: str = "mp3") -> str:
@@ -199,15 +363,12 @@ class VideoConverter:
         
         try:
             print(f"Loading video: {resolved_video_path}")
-            # Load the video
-            video = VideoFileClip(resolved_video_path)
-            
             print(f"Extracting audio to: {audio_path}")
-            # Extract and save audio
-            video.audio.write_audiofile(audio_path)
             
-            # Close the video clip to free memory
-            video.close()
+            if shutil.which("ffmpeg"):
+                VideoConverter._extract_with_ffmpeg(resolved_video_path, audio_path)
+            else:
+                VideoConverter._extract_with_moviepy(resolved_video_path, audio_path)
             
             print(f"Audio extraction completed successfully!")
             return audio_path
@@ -215,6 +376,97 @@ class VideoConverter:
         except Exception as e:
             raise Exception(f"Error during audio extraction: {str(e)}")
     
+    @staticmethod
+    def extract_audio_fast(video_path: str) -> str:
+        """
+        Extract audio in whatever container the source codec already fits.
+        
+        AAC tracks are copied into an .m4a file and MP3 tracks into an .mp3 file,
+        so the audio is only remuxed, never decoded and re-encoded. Any other
+        codec (or a missing ffmpeg) falls back to a regular MP3 extraction.
+        
+        Args:
+            video_path (str): Path to the input video file (shortcuts are resolved)
+            
+        Returns:
+            str: Path to the extracted audio file, next to the video
+        """
+        audio_format = "mp3"
+        if shutil.which("ffmpeg"):
+            source_codec = VideoConverter._probe_audio_codec(PathUtils.resolve_path(video_path))
+            audio_format = VideoConverter.NATIVE_CONTAINERS.get(source_codec, audio_format)
+        
+        return VideoConverter.extract_audio(video_path, audio_format=audio_format)
+    
+    @staticmethod
+    def extract_pcm(video_path: str, sample_rate: int = 16000,
+                    progress_callback: Optional[Callable[[float], None]] = None):
+        """
+        Decode the audio track of a file to mono float32 PCM in memory.
+        
+        ffmpeg writes raw float32 samples to a pipe, so no intermediate audio
+        file is encoded, written and decoded again. The samples are read into a
+        buffer preallocated from the probed duration, so large files don't go
+        through repeated reallocation and copying.
+        
+        Args:
+            video_path (str): Path to the input video (or audio) file
+            sample_rate (int): Output sample rate (default: 16000, as used by Whisper)
+            progress_callback (callable, optional): Called with the decoded fraction
+                                                    of the file (0.0-1.0)
+            
+        Returns:
+            numpy.ndarray: Float32 samples in the range [-1, 1]
+            
+        Raises:
+            FileNotFoundError: If the video file doesn't exist
+            Exception: If ffmpeg fails to decode the file
+        """
+        import numpy as np
+        
+        resolved_video_path = PathUtils.resolve_path(video_path)
+        if not os.path.exists(resolved_video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path} (resolved to: {resolved_video_path})")
+        
+        # float32 mono: 4 bytes per sample, plus slack for rounding of the duration
+        duration = VideoConverter._probe_duration(resolved_video_path) or 0.0
+        expected_size = int(duration * sample_rate) * 4
+        buffer = bytearray(expected_size + 65536)
+        view = memoryview(buffer)
+        size = 0
+        
+        # stderr goes to a temporary file rather than a pipe: a pipe is only read once
+        # stdout hits EOF, so a file producing lots of decode errors would fill it and
+        # stall ffmpeg while we wait on stdout
+        with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
+            ["ffmpeg", "-v", "error", "-i", resolved_video_path, "-vn",
+             "-ac", "1", "-ar", str(sample_rate), "-f", "f32le", "pipe:1"],
+            stdout=subprocess.PIPE, stderr=stderr_file, bufsize=1 << 20
+        ) as proc:
+            while True:
+                if size == len(buffer):
+                    # Duration estimate was too short: double the buffer
+                    view.release()
+                    buffer.extend(bytes(len(buffer)))
+                    view = memoryview(buffer)
+                # Bounded slices: a buffered readinto() only returns once the slice
+                # is full, so an unbounded one would report progress once, at EOF
+                read = proc.stdout.readinto(view[size:size + PCM_READ_CHUNK])
+                if not read:
+                    break
+                size += read
+                if progress_callback and expected_size:
+                    progress_callback(min(size / expected_size, 1.0))
+            view.release()
+            proc.wait()
+            stderr_file.seek(0)
+            errors = stderr_file.read()
+        
+        if proc.returncode != 0:
+            raise Exception(f"ffmpeg failed: {errors.decode(errors='replace').strip()}")
+        
+        return np.frombuffer(buffer, np.float32, count=size // 4)
+    
     @staticmethod
     def extract_audio_interactive() -> Optional[str]:
         """
@@ -257,15 +509,22 @@ class VideoConverter:
     
     @staticmethod
     def batch_convert(video_directory: str, output_directory: Optional[str] = None,
-                     audio_format: str = "mp3") -> list:
+                     audio_format: str = "mp3", max_workers: Optional[int] = None) -> list:
         """
         Convert multiple video files to audio in a directory.
         
+        Files are converted in parallel. With ffmpeg available the work happens in
+        ffmpeg subprocesses, so lightweight threads are enough to drive them; the
+        moviepy fallback decodes in Python and uses worker processes instead.
+        
         Args:
             video_directory (str): Directory containing video files
             output_directory (str, optional): Directory for output audio files.
                                             If None, uses the same directory as input
             audio_format (str): Output audio format (default: "mp3")
+            max_workers (int, optional): Number of parallel conversions.
+                                       If None, one per CPU core with ffmpeg,
+                                       half of the CPU cores with moviepy
             
         Returns:
             list: List of paths to the extracted audio files
@@ -278,26 +537,33 @@ class VideoConverter:
         else:
             os.makedirs(output_directory, exist_ok=True)
         
-        # Common video file extensions
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
-        
-        video_files = []
-        for file in os.listdir(video_directory):
-            if Path(file).suffix.lower() in video_extensions:
-                video_files.append(os.path.join(video_directory, file))
-        
-        extracted_files = []
-        for video_file in video_files:
-            try:
-                video_name = Path(video_file).stem
-                audio_path = os.path.join(output_directory, f"{video_name}.{audio_format}")
-                result = VideoConverter.extract_audio(video_file, audio_path, audio_format)
-                extracted_files.append(result)
-            except Exception as e:
-                print(f"Failed to convert {video_file}: {str(e)}")
-                continue
-        
-        return extracted_files
+        with os.scandir(video_directory) as entries:
+            video_files = [entry.path for entry in entries
+                           if entry.is_file()
+                           and entry.name.rpartition('.')[2].lower() in _VIDEO_EXTS]
+        
+        has_ffmpeg = shutil.which("ffmpeg") is not None
+        cpu_count = os.cpu_count() or 2
+        if max_workers is None:
+            max_workers = cpu_count if has_ffmpeg else max(1, cpu_count // 2)
+        
+        executor_class = ThreadPoolExecutor if has_ffmpeg else ProcessPoolExecutor
+        with executor_class(max_workers=max_workers) as executor:
+            results = list(executor.map(_convert_one, video_files,
+                                        repeat(output_directory), repeat(audio_format)))
+        
+        return [path for path in results if path is not None]
+
+
+def _convert_one(video_file: str, output_directory: str, audio_format: str) -> Optional[str]:
+    """Convert a single file for VideoConverter.batch_convert(); returns None on failure."""
+    try:
+        video_name = Path(video_file).stem
+        audio_path = os.path.join(output_directory, f"{video_name}.{audio_format}")
+        return VideoConverter.extract_audio(video_file, audio_path, audio_format)
+    except Exception as e:
+        print(f"Failed to convert {video_file}: {str(e)}")
+        return None
 
 
 def main():
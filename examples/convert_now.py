@@ -3,9 +3,41 @@
 Quick video to audio conversion for your specific file
 """
 
-from moviepy import VideoFileClip
+import sys
+import json
+import subprocess
 from pathlib import Path
 
+# Add the parent directory to path to import from core
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.video_converter import VideoConverter
+
+def probe_video(video_path):
+    """
+    Read duration, frame size and FPS with ffprobe (no frame decoding).
+    
+    Returns None when ffprobe isn't installed.
+    """
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "format=duration,size:stream=width,height,r_frame_rate",
+             "-of", "json", video_path],
+            capture_output=True, text=True, check=True
+        )
+    except FileNotFoundError:
+        return None
+    info = json.loads(result.stdout)
+    stream = info["streams"][0] if info.get("streams") else {}
+    numerator, _, denominator = stream.get("r_frame_rate", "0/1").partition("/")
+    denominator = float(denominator or 1)
+    return {
+        "duration": float(info["format"]["duration"]),
+        "size": (stream.get("width"), stream.get("height")),
+        "fps": float(numerator) / denominator if denominator else 0.0
+    }
+
 def convert_your_video():
     """Convert your specific video file to audio"""
     
@@ -19,22 +51,25 @@ def convert_your_video():
         print(f"Output: {audio_path}")
         print()
         
-        # Load the video
+        # Read video info
         print("📹 Loading video...")
-        video = VideoFileClip(video_path)
+        if not Path(video_path).exists():
+            raise FileNotFoundError(video_path)
+        video = probe_video(video_path)
         
-        print(f"📊 Video info:")
-        print(f"   Duration: {video.duration:.1f} seconds ({video.duration/60:.1f} minutes)")
-        print(f"   Size: {video.size}")
-        print(f"   FPS: {video.fps}")
+        if video is not None:
+            print(f"📊 Video info:")
+            print(f"   Duration: {video['duration']:.1f} seconds ({video['duration']/60:.1f} minutes)")
+            print(f"   Size: {list(video['size'])}")
+            print(f"   FPS: {video['fps']:.2f}")
+        else:
+            # extract_audio falls back to moviepy without ffmpeg, so carry on
+            print("ℹ️ ffprobe not found, skipping video info")
         print()
         
-        # Extract and save audio
+        # Extract and save audio (direct ffmpeg call, no frame decoding)
         print("🎵 Extracting audio...")
-        video.audio.write_audiofile(audio_path)
-        
-        # Clean up
-        video.close()
+        VideoConverter.extract_audio(video_path, audio_path)
         
         # Check if file was created
         output_file = Path(audio_path)
@@ -13,6 +13,10 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.video_converter import VideoConverter, PathUtils
+from menu_utils import read_choice
+
+# Resolved once; the menu and the approaches below all share this mapping
+SHORTCUTS = PathUtils.get_common_folders()
 
 
 def approach_1_interactive():
@@ -44,12 +48,20 @@ def approach_2_shortcuts():
     
     for shortcut_path in examples:
         print(f"Trying shortcut: '{shortcut_path}'")
+        
+        # Don't probe inside a shortcut folder that isn't there at all
+        prefix, sep, _ = shortcut_path.partition('/')
+        folder = SHORTCUTS.get(prefix.lower()) if sep else None
+        if folder is not None and not folder.exists():
+            print(f"  ❌ Folder not available: {folder}\n")
+            continue
+        
         try:
             resolved = PathUtils.resolve_path(shortcut_path)
             print(f"  → Resolves to: {resolved}")
             
             if resolved != shortcut_path:  # Path was actually resolved
-                result = VideoConverter.extract_audio(shortcut_path)
+                result = VideoConverter.extract_audio(resolved)
                 print(f"  ✅ Success! Audio saved to: {result}")
                 return  # Stop after first successful conversion
             else:
@@ -92,7 +104,8 @@ def approach_4_smart_path():
         print(f"Found at: {resolved_path}")
         
         if resolved_path != filename:  # File was found
-            result = VideoConverter.extract_audio(filename)  # Use original filename
+            # No particular format is needed here, so keep the source codec if possible
+            result = VideoConverter.extract_audio_fast(filename)  # Use original filename
             print(f"✅ Success! Audio saved to: {result}")
         else:
             print("❌ File not found in common locations (Desktop, OneDrive Desktop, Downloads, etc.)")
@@ -106,8 +119,7 @@ def show_available_shortcuts():
     print("📁 AVAILABLE FOLDER SHORTCUTS:")
     print("You can use these shortcuts instead of full paths:\n")
     
-    shortcuts = PathUtils.get_common_folders()
-    for shortcut, path in shortcuts.items():
+    for shortcut, path in SHORTCUTS.items():
         exists = "✅" if path.exists() else "❌"
         print(f"  {shortcut:15} → {path} {exists}")
     
@@ -133,23 +145,21 @@ def main():
     print("4. Smart path detection")
     print("0. Exit")
     
+    handlers = {
+        "1": approach_1_interactive,
+        "2": approach_2_shortcuts,
+        "3": approach_3_full_path,
+        "4": approach_4_smart_path,
+    }
+    
     while True:
         try:
-            choice = input("\nEnter your choice (0-4): ").strip()
+            choice = read_choice("\nEnter your choice (0-4): ")
             
             if choice == "0":
                 print("Goodbye! 👋")
                 break
-            elif choice == "1":
-                approach_1_interactive()
-            elif choice == "2":
-                approach_2_shortcuts()
-            elif choice == "3":
-                approach_3_full_path()
-            elif choice == "4":
-                approach_4_smart_path()
-            else:
-                print("Invalid choice. Please enter 0-4.")
+            handlers.get(choice, lambda: print("Invalid choice. Please enter 0-4."))()
                 
         except KeyboardInterrupt:
             print("\n\nGoodbye! 👋")
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Menu input shared by the interactive example scripts
+"""
+
+import sys
+
+
+def read_choice(prompt: str) -> str:
+    """
+    Read one menu choice from stdin.
+
+    Reading stdin directly lets a pipe drive the menu as well
+    (e.g. printf '1\\n0\\n' | python script.py). The prompt is only shown on a
+    terminal, and end of input counts as "0" (exit).
+    """
+    if sys.stdin.isatty():
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    return line.strip() if line else "0"
@@ -12,8 +12,16 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from core.audio_transcriber import AudioTranscriber
+from menu_utils import read_choice
 import os
 
+def _stat_or_none(path):
+    """Return os.stat() for path, or None if it can't be accessed."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 def transcribe_your_audio():
     """Transcribe your specific extracted audio file."""
     
@@ -51,44 +59,27 @@ def transcribe_your_audio():
         print("💡 The first time may be slower as Whisper downloads the AI model")
         print()
         
-        # Transcribe and save in multiple formats
+        # Transcribe once, then save the same result in multiple formats
+        result = transcriber.transcribe_audio(audio_path)
+        print()
+        
+        created = {}
         for format_type, output_path in output_files.items():
             print(f"Creating {format_type.upper()} format...")
-            
-            if format_type == "txt":
-                # Detailed text format
-                result_path = transcriber.transcribe_and_save(
-                    audio_path, 
-                    output_path, 
-                    output_format=format_type
-                )
-            elif format_type == "json":
-                # JSON with full details and timestamps
-                result_path = transcriber.transcribe_and_save(
-                    audio_path, 
-                    output_path, 
-                    output_format=format_type
-                )
-            elif format_type == "srt":
-                # Subtitle format for video players
-                result_path = transcriber.transcribe_and_save(
-                    audio_path, 
-                    output_path, 
-                    output_format=format_type
-                )
+            transcriber.save_transcription(result, output_path, format_type)
             
             # Check file size
-            if os.path.exists(result_path):
-                file_size = os.path.getsize(result_path)
-                print(f"✅ {format_type.upper()} created: {result_path} ({file_size} bytes)")
+            st = _stat_or_none(output_path)
+            if st:
+                created[format_type] = output_path
+                print(f"✅ {format_type.upper()} created: {output_path} ({st.st_size} bytes)")
             print()
         
         print("🎉 TRANSCRIPTION COMPLETED SUCCESSFULLY!")
         print("=" * 50)
         print("📁 Your transcription files:")
-        for format_type, path in output_files.items():
-            if os.path.exists(path):
-                print(f"  📄 {format_type.upper()}: {path}")
+        for format_type, path in created.items():
+            print(f"  📄 {format_type.upper()}: {path}")
         
         print()
         print("💡 What you can do with these files:")
@@ -99,22 +90,24 @@ def transcribe_your_audio():
         
         # Show a preview of the transcription
         txt_file = output_files["txt"]
-        if os.path.exists(txt_file):
+        try:
+            f = open(txt_file, 'rb')
+        except FileNotFoundError:
+            f = None
+        if f is not None:
             print("📖 TRANSCRIPTION PREVIEW:")
             print("-" * 50)
             try:
-                with open(txt_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Find the actual transcription text (after the header)
-                    if "TRANSCRIPTION:" in content:
-                        preview = content.split("TRANSCRIPTION:")[-1].strip()
-                        # Show first 300 characters
-                        if len(preview) > 300:
-                            preview = preview[:300] + "..."
-                        print(preview)
-                    else:
-                        # Show first part of file
-                        print(content[:300] + "..." if len(content) > 300 else content)
+                # The header and the first 300 characters fit well within 8 KB,
+                # so don't load the whole transcript just to preview it
+                with f:
+                    head = f.read(8192).decode('utf-8', errors='ignore')
+                # Find the actual transcription text (after the header)
+                marker = "TRANSCRIPTION:"
+                idx = head.find(marker)
+                preview = head[idx + len(marker):].strip() if idx != -1 else head
+                # Show first 300 characters
+                print(preview[:300] + "..." if len(preview) > 300 else preview)
             except Exception as e:
                 print(f"Could not preview file: {e}")
             print("-" * 50)
@@ -153,21 +146,21 @@ def main():
     print("2. Interactive mode (choose any audio file)")
     print("0. Exit")
     
+    handlers = {"1": transcribe_your_audio, "2": transcribe_interactive}
+    
     while True:
         try:
-            choice = input("\nEnter your choice (0-2): ").strip()
+            choice = read_choice("\nEnter your choice (0-2): ")
             
             if choice == "0":
                 print("Goodbye! 👋")
                 break
-            elif choice == "1":
-                transcribe_your_audio()
-                break
-            elif choice == "2":
-                transcribe_interactive()
-                break
-            else:
+            handler = handlers.get(choice)
+            if handler is None:
                 print("Invalid choice. Please enter 0-2.")
+                continue
+            handler()
+            break
                 
         except KeyboardInterrupt:
             print("\n\nGoodbye! 👋")
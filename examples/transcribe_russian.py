@@ -4,9 +4,15 @@ Russian language transcription script
 """
 
 import os
-import whisper
+import sys
 from pathlib import Path
 
+# Add the parent directory to path to import from core
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.audio_transcriber import AudioTranscriber
+from menu_utils import read_choice
+
 def transcribe_russian_audio():
     """Transcribe audio specifically in Russian language."""
     
@@ -24,13 +30,14 @@ def transcribe_russian_audio():
         print("💡 Using 'base' model for better Russian language accuracy")
         
         # Use base model for better accuracy with Russian
-        model = whisper.load_model("base")
+        # (quantized faster-whisper backend when installed, FP16 on GPU otherwise)
+        transcriber = AudioTranscriber(model_size="base")
         
         print("🎵 Transcribing audio in Russian...")
         print("🇷🇺 Language explicitly set to Russian (ru)")
         
         # Explicitly specify Russian language
-        result = model.transcribe(audio_path, language="ru")
+        result = transcriber.transcribe_audio(audio_path, language="ru")
         
         print("✅ Russian transcription completed!")
         print(f"🌍 Language used: {result.get('language', 'ru')}")
@@ -39,24 +46,24 @@ def transcribe_russian_audio():
         # Save Russian transcription
         output_path = r"C:\Users\arman\OneDrive\Desktop\russian_transcription.txt"
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("РУССКАЯ ТРАНСКРИПЦИЯ / RUSSIAN TRANSCRIPTION\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Аудио файл / Audio file: {audio_path}\n")
-            f.write(f"Модель / Model: base\n")
-            f.write(f"Язык / Language: Русский (ru)\n")
-            f.write(f"Длина текста / Text length: {len(result['text'])} символов\n\n")
-            f.write("ТРАНСКРИПЦИЯ / TRANSCRIPTION:\n")
-            f.write("-" * 60 + "\n\n")
-            f.write(result['text'])
-            f.write("\n\n" + "=" * 60 + "\n")
+            f.write("".join([
+                "РУССКАЯ ТРАНСКРИПЦИЯ / RUSSIAN TRANSCRIPTION\n",
+                "=" * 60 + "\n\n",
+                f"Аудио файл / Audio file: {audio_path}\n",
+                "Модель / Model: base\n",
+                "Язык / Language: Русский (ru)\n",
+                f"Длина текста / Text length: {len(result['text'])} символов\n\n",
+                "ТРАНСКРИПЦИЯ / TRANSCRIPTION:\n",
+                "-" * 60 + "\n\n",
+                result['text'],
+                "\n\n" + "=" * 60 + "\n",
+            ]))
         
         print(f"💾 Russian transcription saved to: {output_path}")
         
-        # Also create JSON with detailed segments
-        import json
+        # Also create JSON with detailed segments (serialized with orjson when installed)
         json_output = r"C:\Users\arman\OneDrive\Desktop\russian_transcription_detailed.json"
-        with open(json_output, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        transcriber.save_transcription(result, json_output, "json", json_indent=True)
         
         print(f"📊 Detailed JSON saved to: {json_output}")
         print()
@@ -68,9 +75,13 @@ def transcribe_russian_audio():
         print("-" * 60)
         
         # Show confidence information if available
-        if 'segments' in result and result['segments']:
-            avg_confidence = sum(seg.get('avg_logprob', 0) for seg in result['segments']) / len(result['segments'])
-            print(f"📈 Average confidence: {avg_confidence:.3f}")
+        segments = result.get('segments')
+        if segments:
+            import numpy as np
+            
+            logprobs = np.fromiter((seg.get('avg_logprob', 0.0) for seg in segments),
+                                   dtype=np.float32, count=len(segments))
+            print(f"📈 Average confidence: {float(logprobs.mean()):.3f}")
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -95,20 +106,33 @@ def compare_languages():
         "en": "English"
     }
     
-    model = whisper.load_model("base")
+    # The loaded model is shared with transcribe_russian_audio(), and the audio is
+    # decoded once here for all passes
+    transcriber = AudioTranscriber(model_size="base")
+    try:
+        audio = transcriber.load_audio(audio_path)
+    except Exception as e:
+        print(f"❌ Could not decode audio: {e}")
+        return
     
     results = {}
+    # Forcing the language that auto-detection already picked yields the same
+    # transcript, so that pass reuses the auto result instead of running again
+    auto_result = None
     
     for lang_code, lang_name in languages.items():
         try:
             print(f"\n🌍 Transcribing as {lang_name}...")
             
             if lang_code == "auto":
-                result = model.transcribe(audio_path)
+                result = auto_result = transcriber.transcribe_audio(audio_path, audio=audio)
                 detected_lang = result.get('language', 'unknown')
                 print(f"   Detected language: {detected_lang}")
+            elif auto_result is not None and auto_result.get('language') == lang_code:
+                result = auto_result
+                print("   Same as the auto-detected language, reusing that result")
             else:
-                result = model.transcribe(audio_path, language=lang_code)
+                result = transcriber.transcribe_audio(audio_path, language=lang_code, audio=audio)
             
             results[lang_code] = result['text']
             
@@ -123,13 +147,12 @@ def compare_languages():
     # Save comparison
     comparison_file = r"C:\Users\arman\OneDrive\Desktop\language_comparison.txt"
     with open(comparison_file, 'w', encoding='utf-8') as f:
-        f.write("LANGUAGE COMPARISON RESULTS\n")
-        f.write("=" * 50 + "\n\n")
-        
-        for lang_code, lang_name in languages.items():
-            f.write(f"{lang_name.upper()}:\n")
-            f.write("-" * 30 + "\n")
-            f.write(results.get(lang_code, "No result") + "\n\n")
+        f.write("".join([
+            "LANGUAGE COMPARISON RESULTS\n",
+            "=" * 50 + "\n\n",
+            *(f"{lang_name.upper()}:\n{'-' * 30}\n{results.get(lang_code, 'No result')}\n\n"
+              for lang_code, lang_name in languages.items()),
+        ]))
     
     print(f"\n💾 Comparison saved to: {comparison_file}")
 
@@ -143,21 +166,21 @@ def main():
     print("2. Compare different language results")
     print("0. Exit")
     
+    handlers = {"1": transcribe_russian_audio, "2": compare_languages}
+    
     while True:
         try:
-            choice = input("\nEnter your choice (0-2): ").strip()
+            choice = read_choice("\nEnter your choice (0-2): ")
             
             if choice == "0":
                 print("До свидания! / Goodbye! 👋")
                 break
-            elif choice == "1":
-                transcribe_russian_audio()
-                break
-            elif choice == "2":
-                compare_languages()
-                break
-            else:
+            handler = handlers.get(choice)
+            if handler is None:
                 print("Invalid choice. Please enter 0-2.")
+                continue
+            handler()
+            break
                 
         except KeyboardInterrupt:
             print("\n\nДо свидания! / Goodbye! 👋")
@@ -11,9 +11,10 @@ import threading
 import os
 from pathlib import Path
 
-# Import our modules
-from core.video_converter import VideoConverter
-from core.audio_transcriber import AudioTranscriber
+from core.video_converter import PathUtils
+
+# Compute types CTranslate2 only supports on a CUDA device
+GPU_COMPUTE_TYPES = {"int8_float16", "float16"}
 
 
 class SimpleGUI:
@@ -22,10 +23,14 @@ class SimpleGUI:
         self.root.title("🎬 VideoTranscriber GUI")
         self.root.geometry("600x500")
         
+        # File dialogs opened by the core modules attach to this window
+        PathUtils.set_tk_root(root)
+        
         # Variables
         self.file_path = tk.StringVar()
         self.language = tk.StringVar(value="Auto-detect")
         self.model = tk.StringVar(value="base")
+        self.precision = tk.StringVar(value="Auto")
         self.processing = False
         
         self.create_widgets()
@@ -85,21 +90,58 @@ class SimpleGUI:
                                   values=models, state="readonly")
         model_combo.pack(side=tk.RIGHT)
         
+        # Precision selection (faster-whisper compute type)
+        precision_frame = ttk.Frame(settings_frame)
+        precision_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(precision_frame, text="Precision:").pack(side=tk.LEFT)
+        
+        precisions = {
+            "Auto": None,
+            "int8 (fastest on CPU)": "int8",
+            "int8 + float16 (GPU)": "int8_float16",
+            "float16 (GPU)": "float16",
+            "float32 (most precise)": "float32"
+        }
+        
+        # Only "Auto" until the backend and device are known (see detect_precisions)
+        self.precision_combo = ttk.Combobox(precision_frame, textvariable=self.precision,
+                                           values=["Auto"], state="disabled")
+        self.precision_combo.pack(side=tk.RIGHT)
+        
         # Process button
         self.process_btn = ttk.Button(main, text="🚀 Start Processing", 
                                      command=self.start_processing)
         self.process_btn.pack(pady=20)
         
         # Progress
-        self.progress = ttk.Progressbar(main, mode='indeterminate')
+        self.progress = ttk.Progressbar(main, mode='determinate', maximum=1000)
         self.progress.pack(fill=tk.X, pady=10)
         
         # Status
         self.status = tk.StringVar(value="Ready")
         ttk.Label(main, textvariable=self.status).pack(pady=5)
         
-        # Store languages dict for later use
+        # Store languages and precisions dicts for later use
         self.languages = languages
+        self.precisions = precisions
+        
+        # Checking for a GPU imports the inference runtime, so keep it off the UI thread
+        threading.Thread(target=self.detect_precisions, daemon=True).start()
+    
+    def detect_precisions(self):
+        """Offer only the precisions the installed backend can run on this machine."""
+        from core.audio_transcriber import HAS_FASTER_WHISPER, detect_device
+        
+        if not HAS_FASTER_WHISPER:
+            # openai-whisper picks fp16 (GPU) or fp32 (CPU) by itself
+            return
+        
+        # Same check AudioTranscriber uses to pick the device the model runs on
+        on_gpu = detect_device("faster-whisper") == "cuda"
+        labels = [label for label, compute_type in self.precisions.items()
+                  if on_gpu or compute_type not in GPU_COMPUTE_TYPES]
+        self.root.after(0, lambda: self.precision_combo.configure(values=labels, state="readonly"))
     
     def browse_file(self):
         filetypes = [
@@ -109,7 +151,7 @@ class SimpleGUI:
             ("All files", "*.*")
         ]
         
-        filename = filedialog.askopenfilename(filetypes=filetypes)
+        filename = filedialog.askopenfilename(parent=self.root, filetypes=filetypes)
         if filename:
             self.file_path.set(filename)
     
@@ -124,12 +166,16 @@ class SimpleGUI:
         
         self.processing = True
         self.process_btn.config(state="disabled")
-        self.progress.start()
+        self.progress.configure(value=0)
         
         # Start processing in thread
         thread = threading.Thread(target=self.process_file, daemon=True)
         thread.start()
     
+    def update_progress(self, fraction):
+        """Thread-safe progress update (fraction in 0.0-1.0), called from the worker thread."""
+        self.root.after(0, lambda value=fraction * 1000: self.progress.configure(value=value))
+    
     def process_file(self):
         try:
             input_file = self.file_path.get()
@@ -145,26 +191,29 @@ class SimpleGUI:
             video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm'}
             is_video = input_path.suffix.lower() in video_extensions
             
-            audio_file = input_file
-            
-            # Convert video to audio if needed
-            if is_video:
-                self.status.set("Converting video to audio...")
-                audio_file = output_dir / f"{input_path.stem}.mp3"
-                VideoConverter.extract_audio(input_file, str(audio_file))
-            
-            # Transcribe audio
-            self.status.set("Transcribing audio...")
-            
             language_code = self.languages.get(self.language.get())
             model_size = self.model.get()
+            compute_type = self.precisions.get(self.precision.get())
+            
+            # Imported here so the window opens without loading the transcription stack
+            from core.audio_transcriber import AudioTranscriber
             
-            transcriber = AudioTranscriber(model_size=model_size)
+            transcriber = AudioTranscriber(model_size=model_size, compute_type=compute_type)
             
             # Create transcription files
             txt_file = output_dir / f"{input_path.stem}_transcription.txt"
-            transcriber.transcribe_and_save(str(audio_file), str(txt_file), 
-                                          language=language_code, output_format="txt")
+            
+            if is_video:
+                # Decode the audio track in memory instead of writing an MP3 first
+                self.status.set("Transcribing video...")
+                transcriber.video_to_text(input_file, str(txt_file),
+                                          language=language_code, output_format="txt",
+                                          progress_callback=self.update_progress)
+            else:
+                self.status.set("Transcribing audio...")
+                transcriber.transcribe_and_save(input_file, str(txt_file), 
+                                              language=language_code, output_format="txt",
+                                              progress_callback=self.update_progress)
             
             self.status.set("Complete!")
             
@@ -178,11 +227,11 @@ class SimpleGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Processing failed:\n\n{str(e)}")
             self.status.set("Error occurred")
+            self.update_progress(0)
         
         finally:
             self.processing = False
             self.process_btn.config(state="normal")
-            self.progress.stop()
 
 
 def main():
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests of the core modules that don't need Whisper or real media files
+
+ffmpeg/ffprobe are replaced by small stub scripts on PATH, so these run anywhere
+Python runs (the stubs need a POSIX shell shebang, so they're skipped on Windows).
+"""
+
+import importlib.util
+import os
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.audio_transcriber import _restore_timestamps
+from core.video_converter import VideoConverter
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+CAN_STUB = os.name != "nt"
+
+
+def make_stub_ffmpeg(directory, stderr_bytes=0, stdout_chunks=1, chunk_bytes=4096,
+                     delay=0.0, duration="1.0"):
+    """
+    Put fake ffmpeg/ffprobe executables into a directory.
+
+    The ffmpeg stub writes stderr_bytes of noise to stderr first, then
+    stdout_chunks chunks of zeroed float32 samples, sleeping delay seconds
+    between chunks.
+    """
+    ffmpeg = Path(directory) / "ffmpeg"
+    ffmpeg.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        f"sys.stderr.write('x' * {stderr_bytes})\n"
+        "sys.stderr.flush()\n"
+        f"for _ in range({stdout_chunks}):\n"
+        f"    sys.stdout.buffer.write(bytes({chunk_bytes}))\n"
+        "    sys.stdout.buffer.flush()\n"
+        f"    time.sleep({delay})\n"
+    )
+    ffprobe = Path(directory) / "ffprobe"
+    ffprobe.write_text(f"#!{sys.executable}\nprint('{duration}')\n")
+    for stub in (ffmpeg, ffprobe):
+        stub.chmod(stub.stat().st_mode | stat.S_IXUSR)
+
+
+def run_with_stub(stub_options, timeout=20, **kwargs):
+    """Run extract_pcm on a dummy file with stub ffmpeg; returns (result, error)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        make_stub_ffmpeg(tmp, **stub_options)
+        media = Path(tmp) / "clip.mp4"
+        media.write_bytes(b"")
+
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = VideoConverter.extract_pcm(str(media), **kwargs)
+            except Exception as e:
+                outcome["error"] = e
+
+        old_path = os.environ["PATH"]
+        os.environ["PATH"] = tmp + os.pathsep + old_path
+        try:
+            worker = threading.Thread(target=target, daemon=True)
+            worker.start()
+            worker.join(timeout)
+        finally:
+            os.environ["PATH"] = old_path
+
+        assert not worker.is_alive(), "extract_pcm did not finish (ffmpeg pipe deadlock?)"
+        return outcome.get("result"), outcome.get("error")
+
+
+def test_extract_pcm_with_noisy_stderr():
+    """Lots of ffmpeg warnings must not stall reading the samples."""
+    if not (HAS_NUMPY and CAN_STUB):
+        print("⏭️ Skipped: needs numpy and a POSIX shell")
+        return
+
+    result, error = run_with_stub({"stderr_bytes": 200_000, "chunk_bytes": 64_000})
+    assert error is None, error
+    assert len(result) == 16_000
+    print("✅ extract_pcm survives 200 KB of ffmpeg stderr")
+
+
+def test_extract_pcm_reports_progress_while_decoding():
+    """Progress must be reported as samples arrive, not only once at the end."""
+    if not (HAS_NUMPY and CAN_STUB):
+        print("⏭️ Skipped: needs numpy and a POSIX shell")
+        return
+
+    fractions = []
+    # 10 chunks of 1 s of audio each, streamed over about a second
+    result, error = run_with_stub(
+        {"stdout_chunks": 10, "chunk_bytes": 64_000, "delay": 0.1, "duration": "10.0"},
+        progress_callback=fractions.append
+    )
+    assert error is None, error
+    assert len(result) == 160_000
+    assert len(fractions) > 1, fractions
+    assert fractions == sorted(fractions) and fractions[-1] == 1.0, fractions
+    print(f"✅ extract_pcm reported progress {len(fractions)} times")
+
+
+def test_whisper_progress_is_forwarded():
+    """openai-whisper's per-window tqdm updates reach the progress callback."""
+    if importlib.util.find_spec("tqdm") is None:
+        print("⏭️ Skipped: needs tqdm")
+        return
+
+    import core.audio_transcriber as audio_transcriber
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Stub of whisper.transcribe that advances a disabled tqdm bar per window,
+        # the way the real one does with its default verbose=None
+        package = Path(tmp) / "whisper"
+        package.mkdir()
+        (package / "__init__.py").write_text("from .transcribe import transcribe\n")
+        (package / "transcribe.py").write_text(
+            "import tqdm\n"
+            "def transcribe(model, audio, **kwargs):\n"
+            "    with tqdm.tqdm(total=3000, disable=True) as pbar:\n"
+            "        for _ in range(3):\n"
+            "            pbar.update(1000)\n"
+            "    return {'text': '', 'segments': [], 'language': 'en'}\n"
+        )
+        saved = {name: sys.modules.pop(name) for name in list(sys.modules)
+                 if name == "whisper" or name.startswith("whisper.")}
+        sys.path.insert(0, tmp)
+        try:
+            import whisper
+            audio_transcriber._forward_whisper_progress()
+
+            class Model:
+                def transcribe(self, audio, **kwargs):
+                    return whisper.transcribe(self, audio, **kwargs)
+
+            transcriber = audio_transcriber.AudioTranscriber.__new__(audio_transcriber.AudioTranscriber)
+            transcriber.backend = "whisper"
+            transcriber.device = "cpu"
+            transcriber.__dict__["model"] = Model()
+
+            fractions = []
+            has_vad = audio_transcriber.HAS_SILERO_VAD
+            audio_transcriber.HAS_SILERO_VAD = False
+            try:
+                transcriber._run_model([0.0], progress_callback=fractions.append)
+            finally:
+                audio_transcriber.HAS_SILERO_VAD = has_vad
+        finally:
+            sys.path.remove(tmp)
+            for name in [name for name in sys.modules
+                         if name == "whisper" or name.startswith("whisper.")]:
+                del sys.modules[name]
+            sys.modules.update(saved)
+
+    assert fractions[:3] == [1 / 3, 2 / 3, 1.0], fractions
+    print(f"✅ openai-whisper reported progress {len(fractions)} times")
+
+
+def test_restore_timestamps_on_chunk_boundaries():
+    """Segment ends on a boundary stay in the chunk they close."""
+    # Speech kept at [1, 3) s and [10, 12) s of the original audio
+    offsets = [(0.0, 1.0), (2.0, 10.0)]
+    segments = [
+        {"start": 0.0, "end": 2.0},   # exactly the first chunk
+        {"start": 2.0, "end": 4.0},   # exactly the second chunk
+        {"start": 1.5, "end": 2.5},   # spans the cut
+        {"start": 0.0, "end": 0.0},   # empty segment at the very start
+    ]
+    _restore_timestamps(segments, offsets)
+
+    expected = [(1.0, 3.0), (10.0, 12.0), (2.5, 10.5), (1.0, 1.0)]
+    assert [(s["start"], s["end"]) for s in segments] == expected, segments
+    print("✅ Boundary timestamps map back to the right speech chunk")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            print(f"Running {name}...")
+            test()
+    print("\nTest completed!")
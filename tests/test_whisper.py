@@ -4,11 +4,274 @@ Simple test of whisper transcription
 """
 
 import os
-import whisper
+import argparse
+import hashlib
+import importlib.util
+import json
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-def test_whisper():
+# CPU inference tuning; these must be set before torch is imported and can be
+# overridden from the environment. BF16 fpmath lets oneDNN run FP32 GEMMs on
+# BF16 units (Arm BF16, x86 AMX) where the hardware has them.
+os.environ.setdefault("DNNL_DEFAULT_FPMATH_MODE", "BF16")
+os.environ.setdefault("LRU_CACHE_CAPACITY", "1024")
+os.environ.setdefault("THP_MEM_ALLOC_ENABLE", "1")
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+
+# faster-whisper (CTranslate2, int8) is used when installed; set WHISPER_BACKEND=whisper
+# to test the reference openai-whisper implementation instead
+BACKEND = os.environ.get("WHISPER_BACKEND") or (
+    "faster-whisper" if importlib.util.find_spec("faster_whisper") else "whisper")
+
+# WHISPER_BACKEND=onnx runs the int8 ONNX Runtime export made by tools/export_whisper_onnx.py,
+# one directory per model size (whisper-tiny-onnx, whisper-base-onnx, ...)
+ONNX_ROOT = Path(__file__).resolve().parent.parent
+
+# WHISPER_CHUNKED=1 transcribes 30 s windows concurrently (faster-whisper only: a
+# CTranslate2 model serves parallel requests, while openai-whisper installs
+# per-call KV-cache hooks on the shared model and can't be called from threads)
+CHUNKED = os.environ.get("WHISPER_CHUNKED") == "1" and BACKEND == "faster-whisper"
+CHUNK_SECONDS = 30
+CHUNK_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# WHISPER_STREAM=1 decodes the file in 30 s blocks piped from ffmpeg, so memory stays
+# constant instead of holding the whole decoded file
+STREAMING = os.environ.get("WHISPER_STREAM") == "1" and BACKEND != "onnx"
+SAMPLE_RATE = 16000
+
+# Audio files listed when the test file is missing
+AUDIO_SUFFIXES = ('.mp3', '.wav', '.m4a')
+
+# Repo-local copy of openai-whisper checkpoints that later runs memory-map
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".whisper_cache"
+
+# WHISPER_RESULT_CACHE=1 reuses a previous transcription of identical audio with the
+# same settings (stored in CACHE_DIR) instead of loading a model and transcribing
+RESULT_CACHE = os.environ.get("WHISPER_RESULT_CACHE") == "1"
+# Larger files are keyed by size and mtime instead of hashing their contents
+HASH_LIMIT = 100 * 1024 * 1024
+
+def load_whisper_cached(name):
+    """
+    Load an openai-whisper model on CPU, memory-mapping its weights from CACHE_DIR.
+    
+    The first run saves the dims and state_dict after a regular whisper.load_model;
+    later runs map that file instead of parsing and unpacking the checkpoint again.
+    """
+    import torch
+    import whisper
+    from whisper.model import ModelDimensions, Whisper
+    
+    cache_file = CACHE_DIR / f"{name}.pt"
+    if not cache_file.exists():
+        model = whisper.load_model(name, device="cpu")
+        CACHE_DIR.mkdir(exist_ok=True)
+        torch.save({"dims": model.dims.__dict__, "model_state_dict": model.state_dict()}, cache_file)
+        return model
+    
+    checkpoint = torch.load(cache_file, mmap=True, map_location="cpu", weights_only=True)
+    model = Whisper(ModelDimensions(**checkpoint["dims"]))
+    model.load_state_dict(checkpoint["model_state_dict"], assign=True)
+    # Alignment heads aren't part of the state_dict; restore them like load_model does
+    if name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[name])
+    return model
+
+def cache_whisper_assets():
+    """
+    Memoize openai-whisper's mel filterbank and tokenizer construction.
+    
+    Recent whisper releases already cache both; older ones reread the filterbank
+    .npz and rebuild the BPE vocabulary on every transcribe() call. The tokenizer
+    factory is imported by name into the decoding and transcribe modules, so it
+    is replaced there as well.
+    """
+    whisper_audio = importlib.import_module("whisper.audio")
+    if not hasattr(whisper_audio.mel_filters, "cache_info"):
+        whisper_audio.mel_filters = lru_cache(maxsize=4)(whisper_audio.mel_filters)
+    
+    whisper_tokenizer = importlib.import_module("whisper.tokenizer")
+    if not hasattr(whisper_tokenizer.get_tokenizer, "cache_info"):
+        get_tokenizer = lru_cache(maxsize=8)(whisper_tokenizer.get_tokenizer)
+        for module_name in ("whisper.tokenizer", "whisper.decoding", "whisper.transcribe"):
+            importlib.import_module(module_name).get_tokenizer = get_tokenizer
+
+def load_onnx_pipeline(name):
+    """Build an ASR pipeline on the exported ONNX model with all graph optimizations."""
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import WhisperProcessor, pipeline
+    
+    model_dir = ONNX_ROOT / f"whisper-{name}-onnx"
+    if not model_dir.exists():
+        raise FileNotFoundError(f"{model_dir} not found; run "
+                                f"tools/export_whisper_onnx.py --model openai/whisper-{name} first")
+    
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = int(os.environ["OMP_NUM_THREADS"])
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(
+        model_dir, provider="CPUExecutionProvider", session_options=options)
+    processor = WhisperProcessor.from_pretrained(model_dir)
+    return pipeline("automatic-speech-recognition", model=model, tokenizer=processor.tokenizer,
+                    feature_extractor=processor.feature_extractor, chunk_length_s=30)
+
+@lru_cache(maxsize=1)
+def load_model(name="tiny"):
+    """Load a Whisper model for BACKEND, optionally int8-quantized (WHISPER_QUANT=int8)."""
+    if BACKEND == "onnx":
+        return load_onnx_pipeline(name)
+    if BACKEND == "faster-whisper":
+        from faster_whisper import WhisperModel
+        return WhisperModel(name, device="cpu", compute_type="int8",
+                            num_workers=CHUNK_WORKERS if CHUNKED else 1)
+    
+    import torch
+    torch.set_num_threads(int(os.environ["OMP_NUM_THREADS"]))
+    cache_whisper_assets()
+    model = load_whisper_cached(name)
+    if os.environ.get("WHISPER_QUANT") != "int8":
+        return model.to("cuda" if torch.cuda.is_available() else "cpu")
+    
+    # Dynamic int8 quantization of the Linear layers only runs on CPU
+    print("⚙️ Applying dynamic int8 quantization (WHISPER_QUANT=int8)")
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+def result_cache_path(audio_path, model_name):
+    """Cache file for a transcription of this audio with the current settings."""
+    settings = "|".join([BACKEND, model_name, os.environ.get("WHISPER_QUANT", ""),
+                         "chunked" if CHUNKED else "streamed" if STREAMING else "whole"])
+    digest = hashlib.blake2b(settings.encode(), digest_size=16)
+    
+    st = os.stat(audio_path)
+    if st.st_size > HASH_LIMIT:
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+    else:
+        with open(audio_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return CACHE_DIR / f"{digest.hexdigest()}.json"
+
+def split_audio(audio_path, output_dir, seconds=CHUNK_SECONDS):
+    """Cut audio into 16 kHz mono WAV windows of the given length with ffmpeg."""
+    pattern = os.path.join(output_dir, "chunk%04d.wav")
+    subprocess.run(["ffmpeg", "-v", "error", "-i", audio_path, "-f", "segment",
+                    "-segment_time", str(seconds), "-ar", "16000", "-ac", "1", pattern],
+                   check=True)
+    return sorted(str(p) for p in Path(output_dir).glob("chunk*.wav"))
+
+def transcribe_chunked(model, audio_path):
+    """Transcribe independent 30 s windows in parallel and join them in order."""
+    def run(chunk):
+        segments, info = model.transcribe(chunk, beam_size=1, condition_on_previous_text=False)
+        return "".join(seg.text for seg in segments), info.language
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        chunks = split_audio(audio_path, tmp)
+        print(f"✂️ Transcribing {len(chunks)} chunks with {CHUNK_WORKERS} workers")
+        with ThreadPoolExecutor(max_workers=CHUNK_WORKERS) as executor:
+            results = list(executor.map(run, chunks))
+    
+    return {"text": "".join(text for text, _ in results),
+            "language": results[0][1] if results else "unknown"}
+
+def stream_blocks(audio_path, seconds=CHUNK_SECONDS):
+    """
+    Yield 16 kHz mono float32 blocks of the given length decoded by ffmpeg.
+    
+    Every block is a view of the same reusable buffer, so consume it before
+    asking for the next one. Raises CalledProcessError if ffmpeg fails, so an
+    unreadable file isn't mistaken for a short one.
+    """
+    import numpy as np
+    
+    buffer = bytearray(seconds * SAMPLE_RATE * 4)
+    view = memoryview(buffer)
+    process = subprocess.Popen(
+        ["ffmpeg", "-v", "error", "-i", audio_path, "-f", "f32le",
+         "-ac", "1", "-ar", str(SAMPLE_RATE), "-"],
+        stdout=subprocess.PIPE
+    )
+    try:
+        while True:
+            filled = 0
+            while filled < len(buffer):
+                n = process.stdout.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            if filled:
+                yield np.frombuffer(buffer, dtype=np.float32, count=filled // 4)
+            if filled < len(buffer):
+                break
+    finally:
+        process.stdout.close()
+        process.wait()
+    # Only reached when the whole stream was read; a consumer that stops early
+    # closes the pipe, and ffmpeg exiting on the broken pipe is expected then
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+
+def transcribe_streaming(model, audio_path):
+    """
+    Transcribe fixed 30 s blocks one at a time with constant memory use.
+    
+    The language detected on the first block is passed for all later blocks,
+    which skips their language-ID pass. If the first block is silence or music
+    it can be misdetected, and then the whole file is decoded in that language.
+    """
+    texts = []
+    language = None
+    for block in stream_blocks(audio_path):
+        if BACKEND == "faster-whisper":
+            segments, info = model.transcribe(block, language=language, beam_size=1,
+                                              condition_on_previous_text=False)
+            texts.append("".join(seg.text for seg in segments).strip())
+            language = language or info.language
+        else:
+            import torch
+            import whisper
+            mel = whisper.log_mel_spectrogram(whisper.pad_or_trim(torch.from_numpy(block)))
+            options = whisper.DecodingOptions(language=language,
+                                              fp16=model.device.type == "cuda")
+            result = whisper.decode(model, mel.to(model.device), options)
+            texts.append(result.text)
+            language = language or result.language
+    return {"text": " ".join(texts), "language": language or "unknown"}
+
+def transcribe(model, audio_path):
+    """Transcribe a file and return a {"text", "language"} dict for any backend."""
+    if BACKEND != "whisper":
+        return run_transcription(model, audio_path)
+    
+    # Skip all autograd bookkeeping (version counters, view tracking) in the
+    # per-token decoder loop; whisper itself only disables gradients
+    import torch
+    with torch.inference_mode():
+        return run_transcription(model, audio_path)
+
+def run_transcription(model, audio_path):
+    """Dispatch to the transcription mode selected by BACKEND and the environment."""
+    if CHUNKED:
+        return transcribe_chunked(model, audio_path)
+    if STREAMING:
+        return transcribe_streaming(model, audio_path)
+    if BACKEND == "onnx":
+        # The pipeline doesn't report the language it detected
+        return {"text": model(audio_path)["text"], "language": "unknown"}
+    if BACKEND == "faster-whisper":
+        segments, info = model.transcribe(audio_path, beam_size=1)
+        return {"text": "".join(seg.text for seg in segments), "language": info.language}
+    # fp16 only on GPU; on CPU whisper would warn and fall back to FP32 anyway
+    return model.transcribe(audio_path, fp16=model.device.type == "cuda")
+
+def test_whisper(model_name=None):
     """Test whisper functionality step by step."""
+    model_name = model_name or os.environ.get("WHISPER_MODEL", "tiny")
     
     print("🧪 Testing Whisper Setup")
     print("=" * 40)
@@ -27,30 +290,45 @@ def test_whisper():
         desktop_dir = Path.home() / "OneDrive" / "Desktop"
         if desktop_dir.exists():
             print(f"Desktop directory exists: {desktop_dir}")
-            print("Files on desktop:")
-            for file in desktop_dir.iterdir():
-                if file.suffix.lower() in ['.mp3', '.wav', '.m4a']:
-                    print(f"  🎵 {file.name} ({file.stat().st_size/1024/1024:.2f} MB)")
+            # Build the listing first and print it in one write; scandir entries
+            # carry the stat data from the directory read (on Windows, at least)
+            lines = ["Files on desktop:"]
+            with os.scandir(desktop_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(AUDIO_SUFFIXES):
+                        lines.append(f"  🎵 {entry.name} ({entry.stat().st_size/1024/1024:.2f} MB)")
+            print("\n".join(lines))
         else:
             print(f"Desktop directory not found: {desktop_dir}")
         return
     
     try:
-        print("\n🤖 Loading Whisper model...")
-        model = whisper.load_model("tiny")  # Use smallest model for testing
-        print("✅ Whisper model loaded!")
-        
-        print(f"\n🎵 Testing transcription on: {audio_path}")
-        result = model.transcribe(audio_path)
+        cache_file = result_cache_path(audio_path, model_name) if RESULT_CACHE else None
+        if cache_file is not None and cache_file.exists():
+            print(f"\n♻️ Using cached transcription: {cache_file}")
+            result = json.loads(cache_file.read_bytes())
+        else:
+            print(f"\n🤖 Loading Whisper model '{model_name}' ({BACKEND})...")
+            model = load_model(model_name)  # Smallest model by default for testing
+            print("✅ Whisper model loaded!")
+            
+            print(f"\n🎵 Testing transcription on: {audio_path}")
+            result = transcribe(model, audio_path)
+            
+            if cache_file is not None:
+                CACHE_DIR.mkdir(exist_ok=True)
+                cache_file.write_bytes(json.dumps(
+                    {"text": result["text"], "language": result.get("language", "unknown")},
+                    ensure_ascii=False).encode("utf-8"))
         
         print("✅ Transcription successful!")
         print(f"🌍 Detected language: {result.get('language', 'unknown')}")
         print(f"📝 Text preview: {result['text'][:100]}...")
         
         # Save simple text file
+        # Encode once and write the bytes directly, skipping the text I/O layer
         output_path = r"C:\Users\arman\OneDrive\Desktop\test_transcription.txt"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(result['text'])
+        Path(output_path).write_bytes(result['text'].encode('utf-8'))
         
         print(f"💾 Transcription saved to: {output_path}")
         
@@ -63,4 +341,8 @@ def test_whisper():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_whisper()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simple test of whisper transcription")
+    parser.add_argument("--model", default=None,
+                        help="Whisper model to test (default: $WHISPER_MODEL or 'tiny'); "
+                             "use an English-only model such as 'tiny.en' for English audio")
+    test_whisper(parser.parse_args().model)
\ No newline at end of file
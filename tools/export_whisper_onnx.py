@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Export a Whisper model to ONNX Runtime with graph fusion and int8 quantization
+
+The exported directory is used by tests/test_whisper.py with WHISPER_BACKEND=onnx.
+Requires: pip install "optimum[onnxruntime]"
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Exports go to <repo>/<checkpoint name>-onnx, e.g. whisper-tiny-onnx, where the tests look for them
+OUTPUT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def export(model: str, output_dir: Path, isa: str):
+    """
+    Export, fuse and quantize a Whisper checkpoint.
+
+    Args:
+        model (str): Hugging Face model id, e.g. "openai/whisper-tiny"
+        output_dir (Path): Directory for the quantized ONNX model
+        isa (str): Target instruction set for int8 kernels (avx2, avx512, avx512_vnni, arm64)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # O3 = all CPU-safe graph fusions (O4 adds fp16, which only pays off on GPU)
+        print(f"📦 Exporting {model} to ONNX with graph fusion...")
+        subprocess.run(["optimum-cli", "export", "onnx", "--model", model,
+                        "--task", "automatic-speech-recognition", "--optimize", "O3", tmp],
+                       check=True)
+
+        print(f"⚙️ Quantizing to int8 for {isa}...")
+        subprocess.run(["optimum-cli", "onnxruntime", "quantize", "--onnx_model", tmp,
+                        f"--{isa}", "-o", str(output_dir)],
+                       check=True)
+
+        # Give the quantized graphs the default names so from_pretrained() finds them
+        for file in output_dir.glob("*_quantized.onnx"):
+            file.replace(file.with_name(file.name.replace("_quantized", "")))
+
+        # The quantizer only writes the ONNX graphs; keep the configs and
+        # tokenizer/feature-extractor files next to them
+        for file in Path(tmp).iterdir():
+            if file.suffix != ".onnx" and not (output_dir / file.name).exists():
+                shutil.copy2(file, output_dir / file.name)
+
+    print(f"✅ ONNX model saved to: {output_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="openai/whisper-tiny", help="Hugging Face model id")
+    parser.add_argument("--output", type=Path,
+                        help="Output directory (default: <checkpoint name>-onnx in the repository root)")
+    parser.add_argument("--isa", default="avx2", choices=["avx2", "avx512", "avx512_vnni", "arm64"],
+                        help="Instruction set the int8 kernels are tuned for")
+    args = parser.parse_args()
+
+    if shutil.which("optimum-cli") is None:
+        print('❌ optimum-cli not found. Install it with: pip install "optimum[onnxruntime]"')
+        sys.exit(1)
+
+    output = args.output or OUTPUT_ROOT / f"{args.model.rpartition('/')[2]}-onnx"
+    try:
+        export(args.model, output, args.isa)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Export failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()